@@ -6,12 +6,22 @@ from scheduler_app.scheduler_service import TimetableORToolsSolver
 class Command(BaseCommand):
     help = 'Generates the weekly class timetable using Google OR-Tools.'
 
+    def add_arguments(self, parser):
+        parser.add_argument('--workers', type=int, default=None,
+                            help='Number of CP-SAT search workers (defaults to all cores).')
+        parser.add_argument('--time-limit', type=float, default=None,
+                            help='Solver time limit in seconds (default 600).')
+
     def handle(self, *args, **options):
         self.stdout.write(self.style.NOTICE("Starting timetable generation process..."))
-        
-        # Initialize and run the solver
+
+        # Initialize and run the solver, streaming CP-SAT progress to stdout
         scheduler = TimetableORToolsSolver()
-        success, message = scheduler.solve()
+        success, message = scheduler.solve(
+            num_workers=options['workers'],
+            time_limit=options['time_limit'],
+            log_callback=lambda line: self.stdout.write(line),
+        )
         
         if success:
             self.stdout.write(self.style.SUCCESS(message))
@@ -0,0 +1,21 @@
+# Generated by Django 5.2.6 on 2026-08-31 18:53
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('scheduler_app', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='scheduledclass',
+            index=models.Index(fields=['section', 'day', 'period'], name='sched_sec_day_per_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='scheduledclass',
+            index=models.Index(fields=['faculty', 'day', 'period'], name='sched_fac_day_per_idx'),
+        ),
+    ]
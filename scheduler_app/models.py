@@ -1,6 +1,14 @@
+import threading
+from collections import defaultdict
+from contextlib import contextmanager
+
 from django.db import models
 from django.forms import ValidationError
 
+# Thread-local store for FacultyAssignment.bulk_clean_context, so concurrent
+# requests never see each other's preloaded validation data.
+_bulk_clean_state = threading.local()
+
 # Create your models here.
 class Faculty(models.Model):
     name = models.CharField(max_length=100, unique=True)
@@ -73,15 +81,61 @@ class FacultyAssignment(models.Model):
     def __str__(self):
         return f"{self.faculty.name} teaches {self.responsibility} for {self.course_offering}"
 
+    @classmethod
+    def get_subject_counts(cls, faculty_ids):
+        """Returns {faculty_id: set of distinct subject ids} in a single query."""
+        subject_sets = defaultdict(set)
+        rows = cls.objects.filter(faculty_id__in=faculty_ids).values_list(
+            'faculty_id', 'course_offering__subject_id'
+        )
+        for faculty_id, subject_id in rows:
+            subject_sets[faculty_id].add(subject_id)
+        return subject_sets
+
+    @classmethod
+    @contextmanager
+    def bulk_clean_context(cls, queryset):
+        """
+        Preloads assignment data for every faculty in the queryset so that
+        clean() on each member validates against the cache instead of issuing
+        one query per instance. Intended for bulk imports / full_clean() loops:
+
+            with FacultyAssignment.bulk_clean_context(assignments):
+                for assignment in assignments:
+                    assignment.full_clean()
+        """
+        faculty_ids = set(queryset.values_list('faculty_id', flat=True))
+        assignments = defaultdict(list)
+        rows = cls.objects.filter(faculty_id__in=faculty_ids).values_list(
+            'faculty_id', 'pk', 'course_offering__subject_id'
+        )
+        # Keep the pk so clean() can still exclude the instance being validated.
+        for faculty_id, pk, subject_id in rows:
+            assignments[faculty_id].append((pk, subject_id))
+        _bulk_clean_state.assignments = dict(assignments)
+        try:
+            yield
+        finally:
+            del _bulk_clean_state.assignments
+
     def clean(self):
         """Validation for the 'at most two subjects per faculty' rule."""
         super().clean()
-        if self.faculty:
-            # Get all course offerings this faculty is assigned to, excluding the current assignment instance.
-            assigned_offerings = FacultyAssignment.objects.filter(faculty=self.faculty).exclude(pk=self.pk)
-            # Find distinct subject IDs from those offerings.
-            distinct_subject_ids = set(assigned_offerings.values_list('course_offering__subject_id', flat=True))
-            
+        if self.faculty_id:
+            cached_assignments = getattr(_bulk_clean_state, 'assignments', None)
+            if cached_assignments is not None:
+                # Inside bulk_clean_context: validate against the preloaded cache.
+                distinct_subject_ids = {
+                    subject_id
+                    for pk, subject_id in cached_assignments.get(self.faculty_id, [])
+                    if pk != self.pk
+                }
+            else:
+                # Get all course offerings this faculty is assigned to, excluding the current assignment instance.
+                assigned_offerings = FacultyAssignment.objects.filter(faculty=self.faculty).exclude(pk=self.pk)
+                # Find distinct subject IDs from those offerings.
+                distinct_subject_ids = set(assigned_offerings.values_list('course_offering__subject_id', flat=True))
+
             # Check if the new subject adds to the count.
             is_new_subject = self.course_offering.subject_id not in distinct_subject_ids
             current_subject_count = len(distinct_subject_ids)
@@ -127,6 +181,12 @@ class ScheduledClass(models.Model):
             ('day', 'period', 'section'),      # A section can only attend one class at a time.
             ('day', 'period', 'faculty'),      # A faculty member can only teach one class at a time.
         ]
+        # The unique indexes above all lead with (day, period), so section- or
+        # faculty-filtered reads (e.g. the timetable view) would otherwise scan.
+        indexes = [
+            models.Index(fields=['section', 'day', 'period'], name='sched_sec_day_per_idx'),
+            models.Index(fields=['faculty', 'day', 'period'], name='sched_fac_day_per_idx'),
+        ]
         ordering = ['day', 'period', 'section']
 
     def __str__(self):
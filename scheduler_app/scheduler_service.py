@@ -1,4 +1,9 @@
 import collections
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from django.db import transaction
+from django.db.models import Prefetch
 from ortools.sat.python import cp_model
 
 from .models import (
@@ -11,6 +16,88 @@ from .models import (
 # Adjust these values if your school's schedule differs.
 DAYS = range(1, 7)  # 1 = Monday, 2 = Tuesday, ..., 6 = Saturday
 PERIODS = range(1, 9) # 1 through 8
+NUM_SLOTS = len(DAYS) * len(PERIODS)  # Flat timeslot index: slot = (day-1)*8 + (period-1)
+
+# Variable names are serialized into the CP-SAT model proto and can dominate
+# its size on large instances. Leave this off in production; flip it on when
+# a readable model dump is needed for debugging.
+_DEBUG_NAMES = False
+
+
+def _vname(name):
+    """Returns the given variable name when debug naming is on, else empty."""
+    return name if _DEBUG_NAMES else ""
+
+
+def _solve_day_subproblem(day, day_requirements, num_rooms, time_limit, num_workers):
+    """
+    Solves the schedule for a single day in isolation. Module-level so it can
+    be shipped to a worker process. Returns (day, {req_id: (period, room_index)})
+    on success, or (day, None) if no valid arrangement exists for this day's
+    requirements.
+    """
+    model = cp_model.CpModel()
+    num_periods = len(PERIODS)
+
+    start_vars, room_vars, slot_intervals, room_intervals = {}, {}, {}, {}
+    for req in day_requirements:
+        req_id = req["id"]
+        start_vars[req_id] = model.NewIntVar(0, num_periods - 1, _vname(f"t_{req_id}"))
+        room_vars[req_id] = model.NewIntVar(0, num_rooms - 1, _vname(f"r_{req_id}"))
+        slot_intervals[req_id] = model.NewFixedSizeIntervalVar(start_vars[req_id], 1, _vname(f"ti_{req_id}"))
+        room_intervals[req_id] = model.NewFixedSizeIntervalVar(room_vars[req_id], 1, _vname(f"ri_{req_id}"))
+
+    req_ids_by_section = collections.defaultdict(list)
+    req_ids_by_faculty = collections.defaultdict(list)
+    req_ids_by_section_subject = collections.defaultdict(list)
+    for r in day_requirements:
+        req_ids_by_section[r["section_id"]].append(r["id"])
+        req_ids_by_faculty[r["faculty_id"]].append(r["id"])
+        req_ids_by_section_subject[(r["section_id"], r["subject_id"])].append(r["id"])
+
+    # Same rule set as the monolithic model, restricted to one day: section,
+    # faculty and room exclusivity plus the no-consecutive-subject rule
+    # (which is trivially same-day here, so no day channel is needed).
+    for group in req_ids_by_section.values():
+        model.AddAllDifferent(start_vars[req_id] for req_id in group)
+    for group in req_ids_by_faculty.values():
+        model.AddAllDifferent(start_vars[req_id] for req_id in group)
+    all_ids = [r["id"] for r in day_requirements]
+    model.AddNoOverlap2D(
+        [slot_intervals[req_id] for req_id in all_ids],
+        [room_intervals[req_id] for req_id in all_ids],
+    )
+    for group in req_ids_by_section_subject.values():
+        for i, req_a in enumerate(group):
+            for req_b in group[i + 1:]:
+                model.Add(start_vars[req_a] - start_vars[req_b] != 1)
+                model.Add(start_vars[req_b] - start_vars[req_a] != 1)
+
+    # Identical copies that landed on the same day stay interchangeable.
+    copy_groups = collections.defaultdict(list)
+    for r in day_requirements:
+        copy_groups[(r["section_id"], r["subject_id"], r["faculty_id"], r["class_type"])].append(r["id"])
+    for group in copy_groups.values():
+        for req_a, req_b in zip(group, group[1:]):
+            model.Add(start_vars[req_a] < start_vars[req_b])
+
+    solver = cp_model.CpSolver()
+    solver.parameters.num_search_workers = num_workers
+    solver.parameters.max_time_in_seconds = time_limit
+    solver.parameters.stop_after_first_solution = True
+    solver.parameters.linearization_level = 0
+    solver.parameters.cp_model_probing_level = 1
+    solver.parameters.use_timetabling_in_no_overlap_2d = True
+    solver.parameters.use_energetic_reasoning_in_no_overlap_2d = True
+
+    status = solver.Solve(model)
+    if status not in (cp_model.OPTIMAL, cp_model.FEASIBLE):
+        return day, None
+    return day, {
+        req_id: (solver.Value(start_vars[req_id]) + 1, solver.Value(room_vars[req_id]))
+        for req_id in all_ids
+    }
+
 
 class TimetableORToolsSolver:
     """
@@ -21,20 +108,55 @@ class TimetableORToolsSolver:
     def __init__(self):
         # 1. Load data from database into memory
         self.all_sections = list(Section.objects.all())
-        self.all_classrooms = list(Classroom.objects.all())
+        # Ordered by (capacity, id) so equal-capacity rooms occupy contiguous
+        # solver indices; _break_symmetries relies on this bucketing.
+        self.all_classrooms = list(Classroom.objects.order_by('capacity', 'id'))
         self.all_faculties = list(Faculty.objects.all())
         
         # 2. Initialize CP-SAT model and solver components
         self.model = cp_model.CpModel()
         self.solver = cp_model.CpSolver()
-        self.variables = {}  # Dictionary to hold solver variables: {(req_id, day, period, room_id): var}
+        # CP-SAT scales nearly linearly with workers on this kind of model,
+        # so use every core by default. Both knobs can be overridden in solve().
+        params = self.solver.parameters
+        params.num_search_workers = os.cpu_count() or 8
+        params.max_time_in_seconds = 600
+        params.log_search_progress = True
+        # This is a pure feasibility problem (no objective), so skip the
+        # LP-based machinery tuned for optimization and stop at the first
+        # schedule that satisfies every constraint.
+        params.stop_after_first_solution = True
+        params.linearization_level = 0
+        params.cp_model_probing_level = 1
+        params.search_branching = cp_model.PORTFOLIO_SEARCH
+        # Stronger propagation for the (timeslot, room) no-overlap grid.
+        params.use_timetabling_in_no_overlap_2d = True
+        params.use_energetic_reasoning_in_no_overlap_2d = True
+        # Per-requirement solver variables, keyed by requirement id.
+        self.start_vars = {}      # Flat timeslot in [0, NUM_SLOTS)
+        self.room_vars = {}       # Classroom index into self.all_classrooms
+        self.slot_intervals = {}  # Unit interval over the timeslot axis
+        self.room_intervals = {}  # Unit interval over the classroom axis
+        self.day_vars = {}        # Day index (start // periods), created on demand
+
+    def solve(self, num_workers=None, time_limit=None, log_callback=None):
+        """
+        Main method to run the solver process.
 
-    def solve(self):
-        """Main method to run the solver process."""
+        num_workers/time_limit override the defaults set in __init__;
+        log_callback receives CP-SAT search-progress lines when given.
+        """
+        if num_workers is not None:
+            self.solver.parameters.num_search_workers = num_workers
+        if time_limit is not None:
+            self.solver.parameters.max_time_in_seconds = time_limit
+        if log_callback is not None:
+            self.solver.log_callback = log_callback
         # 1. Prepare flat list of class requirements from complex models
         self.class_requirements = self._prepare_class_requirements()
         if not self.class_requirements:
             return False, "No class requirements generated. Check CourseOfferings and FacultyAssignments in admin."
+        self._build_requirement_indexes()
 
         # Data validation for resource capacity
         total_required_slots = len(self.class_requirements)
@@ -42,25 +164,47 @@ class TimetableORToolsSolver:
         if total_required_slots > available_slots:
             return False, f"Scheduling impossible: {total_required_slots} classes required, but only {available_slots} classroom slots available."
 
+        # Catch per-entity overloads up front instead of letting CP-SAT burn
+        # the whole time limit proving an impossible model infeasible.
+        feasibility_error = self._check_basic_feasibility()
+        if feasibility_error:
+            return False, feasibility_error
+
         print(f"Starting solver for {total_required_slots} class sessions...")
 
-        # 2. Create solver variables
-        self._create_variables()
-        
-        # 3. Apply all scheduling constraints
-        self._apply_constraints()
-        
-        # 4. Run the solver
-        status = self.solver.Solve(self.model)
-        
-        # 5. Process results
-        if status == cp_model.OPTIMAL or status == cp_model.FEASIBLE:
-            print("Successfully found a valid schedule.")
-            self._save_results()
+        # 2. Fastest path: a greedy placement satisfies every constraint by
+        # construction, so if it seats every session there is nothing to solve.
+        greedy_assignments = self._greedy_initial_assignment()
+        if len(greedy_assignments) == total_required_slots:
+            print("Greedy placement scheduled every session; skipping CP-SAT.")
+            self._save_results(greedy_assignments)
             return True, "Schedule generated successfully."
-        else:
-            status_name = self.solver.StatusName(status)
-            return False, f"Could not generate schedule (Solver status: {status_name}). Constraints may be too tight."
+
+        # 3. Fast path: days are only coupled through the day assignment of
+        # each session, so distribute sessions across days and solve six small
+        # independent models in parallel instead of one 6x larger one.
+        assignments = self._solve_by_day()
+
+        # 4. Fall back to the monolithic model if the day decomposition could
+        # not place everything (the greedy day split is a heuristic). The
+        # partial greedy placement seeds the search as variable hints.
+        if assignments is None:
+            print("Per-day decomposition failed; solving the full weekly model...")
+            self._create_variables()
+            self._apply_constraints()
+            self._break_symmetries()
+            self._add_warm_start_hints(greedy_assignments)
+
+            status = self.solver.Solve(self.model)
+            if status not in (cp_model.OPTIMAL, cp_model.FEASIBLE):
+                status_name = self.solver.StatusName(status)
+                return False, f"Could not generate schedule (Solver status: {status_name}). Constraints may be too tight."
+            assignments = self._extract_assignments()
+
+        # 5. Process results
+        print("Successfully found a valid schedule.")
+        self._save_results(assignments)
+        return True, "Schedule generated successfully."
 
     # --- Step 1: Data Preparation ---
     def _prepare_class_requirements(self):
@@ -71,7 +215,13 @@ class TimetableORToolsSolver:
         requirements = []
         req_id_counter = 0
 
-        for offering in CourseOffering.objects.prefetch_related('faculty_assignments__faculty').all():
+        offerings = CourseOffering.objects.select_related('subject', 'section').prefetch_related(
+            Prefetch(
+                'faculty_assignments',
+                queryset=FacultyAssignment.objects.select_related('faculty'),
+            )
+        )
+        for offering in offerings:
             assignments = list(offering.faculty_assignments.all())
             
             # --- Logic for Theory Classes ---
@@ -85,9 +235,9 @@ class TimetableORToolsSolver:
                 for _ in range(offering.required_theory_hours):
                     requirements.append({
                         "id": req_id_counter,
-                        "subject": offering.subject,
-                        "section": offering.section,
-                        "faculty": theory_faculty,
+                        "subject_id": offering.subject_id,
+                        "section_id": offering.section_id,
+                        "faculty_id": theory_faculty.id,
                         "class_type": ScheduledClass.ClassType.THEORY,
                     })
                     req_id_counter += 1
@@ -103,117 +253,360 @@ class TimetableORToolsSolver:
                 for _ in range(offering.required_tutorial_hours):
                     requirements.append({
                         "id": req_id_counter,
-                        "subject": offering.subject,
-                        "section": offering.section,
-                        "faculty": tutorial_faculty,
+                        "subject_id": offering.subject_id,
+                        "section_id": offering.section_id,
+                        "faculty_id": tutorial_faculty.id,
                         "class_type": ScheduledClass.ClassType.TUTORIAL,
                     })
                     req_id_counter += 1
 
         return requirements
 
+    def _build_requirement_indexes(self):
+        """
+        Groups the prepared requirement ids once, in a single pass, for every
+        later consumer: the constraint builder, symmetry breaking, the day
+        splitter, the greedy placer and the feasibility checks.
+        """
+        self.req_ids_by_section = collections.defaultdict(list)
+        self.req_ids_by_faculty = collections.defaultdict(list)
+        self.req_ids_by_section_subject = collections.defaultdict(list)
+        self.copy_groups = collections.defaultdict(list)
+        for r in self.class_requirements:
+            self.req_ids_by_section[r["section_id"]].append(r["id"])
+            self.req_ids_by_faculty[r["faculty_id"]].append(r["id"])
+            self.req_ids_by_section_subject[(r["section_id"], r["subject_id"])].append(r["id"])
+            self.copy_groups[
+                (r["section_id"], r["subject_id"], r["faculty_id"], r["class_type"])
+            ].append(r["id"])
+
+    def _check_basic_feasibility(self):
+        """
+        Cheap necessary conditions on the prepared requirements. Returns an
+        error message for the first violated one, or None if all pass.
+        """
+        section_names = {section.id: section.name for section in self.all_sections}
+        for section_id, req_ids in self.req_ids_by_section.items():
+            load = len(req_ids)
+            if load > NUM_SLOTS:
+                return (f"Scheduling impossible: section '{section_names.get(section_id, section_id)}' "
+                        f"needs {load} class slots but the week only has {NUM_SLOTS}.")
+
+        faculty_names = {faculty.id: faculty.name for faculty in self.all_faculties}
+        for faculty_id, req_ids in self.req_ids_by_faculty.items():
+            load = len(req_ids)
+            if load > NUM_SLOTS:
+                return (f"Scheduling impossible: faculty '{faculty_names.get(faculty_id, faculty_id)}' "
+                        f"is assigned {load} class slots but the week only has {NUM_SLOTS}.")
+
+        # The no-consecutive rule caps one subject at ceil(periods / 2)
+        # sessions per section per day.
+        max_subject_slots = (len(PERIODS) + 1) // 2 * len(DAYS)
+        for (section_id, subject_id), req_ids in self.req_ids_by_section_subject.items():
+            load = len(req_ids)
+            if load > max_subject_slots:
+                subject = Subject.objects.filter(pk=subject_id).first()
+                return (f"Scheduling impossible: section '{section_names.get(section_id, section_id)}' "
+                        f"needs {load} sessions of '{subject or subject_id}', but the no-consecutive "
+                        f"rule allows at most {max_subject_slots} per week.")
+
+        return None
+
+    # --- Greedy Warm Start ---
+    def _greedy_initial_assignment(self):
+        """
+        Places requirements into the earliest free (day, period, room) slot
+        that violates no constraint, hardest faculties first. Returns a
+        possibly partial {req_id: (day, period, room_index)} map; a complete
+        map is itself a valid schedule.
+        """
+        periods_per_day = len(PERIODS)
+        room_indices = range(len(self.all_classrooms))
+
+        ordered = sorted(
+            self.class_requirements,
+            key=lambda r: -len(self.req_ids_by_faculty[r["faculty_id"]]),
+        )
+
+        section_busy = set()   # (day, period, section_id)
+        faculty_busy = set()   # (day, period, faculty_id)
+        room_busy = set()      # (day, period, room_index)
+        subject_periods = collections.defaultdict(set)  # (day, section_id, subject_id) -> {period}
+
+        placed = {}
+        for req in ordered:
+            for slot in range(NUM_SLOTS):
+                day = slot // periods_per_day + 1
+                period = slot % periods_per_day + 1
+                if (day, period, req["section_id"]) in section_busy:
+                    continue
+                if (day, period, req["faculty_id"]) in faculty_busy:
+                    continue
+                taken_periods = subject_periods[(day, req["section_id"], req["subject_id"])]
+                if period - 1 in taken_periods or period + 1 in taken_periods:
+                    continue
+                room_index = next(
+                    (ri for ri in room_indices if (day, period, ri) not in room_busy), None
+                )
+                if room_index is None:
+                    continue
+                placed[req["id"]] = (day, period, room_index)
+                section_busy.add((day, period, req["section_id"]))
+                faculty_busy.add((day, period, req["faculty_id"]))
+                room_busy.add((day, period, room_index))
+                taken_periods.add(period)
+                break
+        return placed
+
+    def _add_warm_start_hints(self, greedy_assignments):
+        """Seeds the monolithic model's search with the partial greedy placement."""
+        for req_id, (day, period, room_index) in greedy_assignments.items():
+            slot = (day - 1) * len(PERIODS) + (period - 1)
+            self.model.AddHint(self.start_vars[req_id], slot)
+            self.model.AddHint(self.room_vars[req_id], room_index)
+
+    # --- Day Decomposition ---
+    def _distribute_requirements_across_days(self):
+        """
+        Greedily spreads class requirements over the week, respecting per-day
+        capacities (section hours, faculty hours, room slots and the
+        no-consecutive cap per subject). Returns {day: [requirement, ...]}, or
+        None if some requirement cannot be placed on any day.
+        """
+        periods_per_day = len(PERIODS)
+        room_slots_per_day = len(self.all_classrooms) * periods_per_day
+        # With no two adjacent periods allowed, a section fits at most
+        # ceil(periods / 2) sessions of one subject per day.
+        max_same_subject_per_day = (periods_per_day + 1) // 2
+
+        # Place the most loaded faculties first: they are the hardest to spread.
+        ordered = sorted(
+            self.class_requirements,
+            key=lambda r: -len(self.req_ids_by_faculty[r["faculty_id"]]),
+        )
+
+        by_day = {day: [] for day in DAYS}
+        section_count = collections.Counter()
+        faculty_count = collections.Counter()
+        subject_count = collections.Counter()
+        total_count = collections.Counter()
+
+        for req in ordered:
+            candidates = [
+                day for day in DAYS
+                if section_count[(day, req["section_id"])] < periods_per_day
+                and faculty_count[(day, req["faculty_id"])] < periods_per_day
+                and subject_count[(day, req["section_id"], req["subject_id"])] < max_same_subject_per_day
+                and total_count[day] < room_slots_per_day
+            ]
+            if not candidates:
+                return None
+            # Prefer the least-loaded day for this requirement's bottlenecks.
+            day = min(candidates, key=lambda d: (
+                subject_count[(d, req["section_id"], req["subject_id"])],
+                section_count[(d, req["section_id"])],
+                faculty_count[(d, req["faculty_id"])],
+                total_count[d],
+            ))
+            by_day[day].append(req)
+            section_count[(day, req["section_id"])] += 1
+            faculty_count[(day, req["faculty_id"])] += 1
+            subject_count[(day, req["section_id"], req["subject_id"])] += 1
+            total_count[day] += 1
+
+        return by_day
+
+    def _solve_by_day(self):
+        """
+        Solves one CP-SAT subproblem per day in parallel worker processes.
+        Returns {req_id: (day, period, room_index)} if every day is feasible,
+        otherwise None.
+        """
+        by_day = self._distribute_requirements_across_days()
+        if by_day is None:
+            return None
+
+        active_days = [day for day in DAYS if by_day[day]]
+        if not active_days:
+            return None
+        num_rooms = len(self.all_classrooms)
+        time_limit = self.solver.parameters.max_time_in_seconds
+        workers_per_day = max(1, (os.cpu_count() or 1) // len(active_days))
+
+        print(f"Solving {len(active_days)} per-day subproblems in parallel...")
+        with ProcessPoolExecutor(max_workers=len(active_days)) as pool:
+            results = pool.map(
+                _solve_day_subproblem,
+                active_days,
+                [by_day[day] for day in active_days],
+                [num_rooms] * len(active_days),
+                [time_limit] * len(active_days),
+                [workers_per_day] * len(active_days),
+            )
+
+        assignments = {}
+        for day, day_result in results:
+            if day_result is None:
+                print(f"Day {day} subproblem was infeasible with the chosen day split.")
+                return None
+            for req_id, (period, room_index) in day_result.items():
+                assignments[req_id] = (day, period, room_index)
+        return assignments
+
     # --- Step 2: Solver Variable Creation ---
     def _create_variables(self):
-        """Creates a boolean variable for each possible class session placement."""
-        for req in self.class_requirements:
-            req_id = req["id"]
-            for day in DAYS:
-                for period in PERIODS:
-                    for room in self.all_classrooms:
-                        self.variables[(req_id, day, period, room.id)] = self.model.NewBoolVar(
-                            f"session_{req_id}_day{day}_p{period}_room{room.id}"
-                        )
+        """
+        Creates one timeslot variable and one classroom variable per class session,
+        plus unit intervals over both axes for the no-overlap room constraint.
+        """
+        # Local bindings and comprehensions: no repeated attribute lookups or
+        # per-variable name formatting (CP-SAT doesn't need readable names).
+        new_int_var = self.model.NewIntVar
+        new_interval = self.model.NewFixedSizeIntervalVar
+        num_rooms = len(self.all_classrooms)
+        req_ids = [req["id"] for req in self.class_requirements]
+
+        # Conditional names (rather than _vname) so the disabled case skips
+        # the f-string formatting entirely in these bulk loops.
+        self.start_vars = {
+            req_id: new_int_var(0, NUM_SLOTS - 1, f"t_{req_id}" if _DEBUG_NAMES else "")
+            for req_id in req_ids
+        }
+        self.room_vars = {
+            req_id: new_int_var(0, num_rooms - 1, f"r_{req_id}" if _DEBUG_NAMES else "")
+            for req_id in req_ids
+        }
+        self.slot_intervals = {
+            req_id: new_interval(self.start_vars[req_id], 1, f"ti_{req_id}" if _DEBUG_NAMES else "")
+            for req_id in req_ids
+        }
+        self.room_intervals = {
+            req_id: new_interval(self.room_vars[req_id], 1, f"ri_{req_id}" if _DEBUG_NAMES else "")
+            for req_id in req_ids
+        }
+
+    def _get_day_var(self, req_id):
+        """Returns (creating if needed) the day-index variable for a requirement."""
+        if req_id not in self.day_vars:
+            day = self.model.NewIntVar(0, len(DAYS) - 1, _vname(f"d_{req_id}"))
+            self.model.AddDivisionEquality(day, self.start_vars[req_id], len(PERIODS))
+            self.day_vars[req_id] = day
+        return self.day_vars[req_id]
 
     # --- Step 3: Constraint Application ---
     def _apply_constraints(self):
         """Applies all scheduling rules to the CP-SAT model."""
-        
-        # --- Constraint 1: Schedule each class requirement exactly once ---
-        for req in self.class_requirements:
-            self.model.AddExactlyOne(
-                self.variables[(req["id"], day, period, room.id)]
-                for day in DAYS for period in PERIODS for room in self.all_classrooms
-            )
 
-        # --- Resource Constraints (at most one activity per resource per time slot) ---
-        for day in DAYS:
-            for period in PERIODS:
-                # Constraint 2: A section can attend only one class at a time.
-                for section in self.all_sections:
-                    req_ids_for_section = [r["id"] for r in self.class_requirements if r["section"] == section]
-                    self.model.AddAtMostOne(
-                        self.variables[(req_id, day, period, room.id)]
-                        for req_id in req_ids_for_section for room in self.all_classrooms
-                    )
-
-                # Constraint 3: A classroom can host only one class at a time.
-                for room in self.all_classrooms:
-                    req_ids_for_room = [r["id"] for r in self.class_requirements]
-                    self.model.AddAtMostOne(
-                        self.variables[(req_id, day, period, room.id)]
-                        for req_id in req_ids_for_room
-                    )
-
-                # Constraint 4: A faculty member can teach only one class at a time.
-                for faculty in self.all_faculties:
-                    req_ids_for_faculty = [r["id"] for r in self.class_requirements if r["faculty"] == faculty]
-                    if req_ids_for_faculty: # Only add constraint if faculty has assigned classes
-                        self.model.AddAtMostOne(
-                            self.variables[(req_id, day, period, room.id)]
-                            for req_id in req_ids_for_faculty for room in self.all_classrooms
-                        )
+        # Constraint 1 (schedule each requirement exactly once) is implicit:
+        # every requirement's timeslot/room variable takes exactly one value.
+
+        # --- Constraint 2: A section can attend only one class at a time. ---
+        for req_ids_for_section in self.req_ids_by_section.values():
+            self.model.AddAllDifferent(self.start_vars[req_id] for req_id in req_ids_for_section)
+
+        # --- Constraint 3: A classroom can host only one class at a time. ---
+        # Two sessions may not occupy the same (timeslot, classroom) cell.
+        all_req_ids = [r["id"] for r in self.class_requirements]
+        self.model.AddNoOverlap2D(
+            [self.slot_intervals[req_id] for req_id in all_req_ids],
+            [self.room_intervals[req_id] for req_id in all_req_ids],
+        )
+
+        # --- Constraint 4: A faculty member can teach only one class at a time. ---
+        for req_ids_for_faculty in self.req_ids_by_faculty.values():
+            self.model.AddAllDifferent(self.start_vars[req_id] for req_id in req_ids_for_faculty)
 
         # --- Constraint 5: No consecutive classes for the same subject and section ---
         # "A section cannot have Subject X in Period 1 and Subject X again in Period 2."
-        for section in self.all_sections:
-            for subject in Subject.objects.filter(courseoffering__section=section).distinct():
-                req_ids_for_subject_section = [
-                    r["id"] for r in self.class_requirements 
-                    if r["section"] == section and r["subject"] == subject
-                ]
-                
-                for day in DAYS:
-                    for p1 in PERIODS:
-                        if p1 + 1 in PERIODS:
-                            p2 = p1 + 1
-                            
-                            # Create temporary boolean variables representing: "Is subject active in period p1/p2?"
-                            is_active_p1 = self.model.NewBoolVar(f"active_{section.id}_{subject.id}_d{day}_p{p1}")
-                            is_active_p2 = self.model.NewBoolVar(f"active_{section.id}_{subject.id}_d{day}_p{p2}")
-
-                            # Link temporary variables to actual schedule variables.
-                            # is_active_p1 = True if any class for this subject/section is scheduled in period p1.
-                            self.model.Add(is_active_p1 == sum(
-                                self.variables[(req_id, day, p1, room.id)]
-                                for req_id in req_ids_for_subject_section for room in self.all_classrooms
-                            ))
-                            self.model.Add(is_active_p2 == sum(
-                                self.variables[(req_id, day, p2, room.id)]
-                                for req_id in req_ids_for_subject_section for room in self.all_classrooms
-                            ))
-
-                            # Constraint: At most one of [is_active_p1, is_active_p2] can be true.
-                            self.model.AddAtMostOne([is_active_p1, is_active_p2])
+        # Two sessions of the same subject/section may not sit in adjacent timeslots
+        # of the same day (adjacency across a day boundary is allowed).
+        for req_ids_for_subject_section in self.req_ids_by_section_subject.values():
+            if len(req_ids_for_subject_section) < 2:
+                continue
+            for i, req_a in enumerate(req_ids_for_subject_section):
+                for req_b in req_ids_for_subject_section[i + 1:]:
+                    same_day = self.model.NewBoolVar(_vname(f"sameday_{req_a}_{req_b}"))
+                    self.model.Add(
+                        self._get_day_var(req_a) == self._get_day_var(req_b)
+                    ).OnlyEnforceIf(same_day)
+                    self.model.Add(
+                        self._get_day_var(req_a) != self._get_day_var(req_b)
+                    ).OnlyEnforceIf(same_day.Not())
+
+                    # Two half-reified linear clauses instead of an auxiliary
+                    # |start_a - start_b| variable: same propagation, no extra
+                    # integer var or AddAbsEquality machinery per pair.
+                    self.model.Add(
+                        self.start_vars[req_a] - self.start_vars[req_b] != 1
+                    ).OnlyEnforceIf(same_day)
+                    self.model.Add(
+                        self.start_vars[req_b] - self.start_vars[req_a] != 1
+                    ).OnlyEnforceIf(same_day)
+
+    def _break_symmetries(self):
+        """
+        Adds constraints that remove equivalent permutations of identical
+        assignments, without excluding any distinct schedule.
+        """
+        # The copies of one offering's theory (or tutorial) hours are fully
+        # interchangeable: same subject, section, faculty and class type. Force
+        # their timeslots into strictly increasing order so CP-SAT explores one
+        # canonical arrangement instead of all k! permutations per group.
+        for group in self.copy_groups.values():
+            for req_a, req_b in zip(group, group[1:]):
+                self.model.Add(self.start_vars[req_a] < self.start_vars[req_b])
+
+        # Classrooms of equal capacity are interchangeable resources (capacity
+        # is the only attribute that could distinguish them). Rooms are sorted
+        # by (capacity, id) in __init__, so each capacity bucket is a
+        # contiguous index range; pinning the first requirement to the first
+        # room of some bucket removes one relabelling degree of freedom.
+        if self.class_requirements and len(self.all_classrooms) > 1:
+            bucket_first_indices = []
+            previous_capacity = None
+            for index, room in enumerate(self.all_classrooms):
+                if room.capacity != previous_capacity:
+                    bucket_first_indices.append(index)
+                    previous_capacity = room.capacity
+            first_req_id = self.class_requirements[0]["id"]
+            self.model.AddLinearExpressionInDomain(
+                self.room_vars[first_req_id],
+                cp_model.Domain.FromValues(bucket_first_indices),
+            )
+
+    def _extract_assignments(self):
+        """Reads the monolithic solve's solution into {req_id: (day, period, room_index)}."""
+        assignments = {}
+        for req in self.class_requirements:
+            req_id = req["id"]
+            slot = self.solver.Value(self.start_vars[req_id])
+            assignments[req_id] = (
+                slot // len(PERIODS) + 1,
+                slot % len(PERIODS) + 1,
+                self.solver.Value(self.room_vars[req_id]),
+            )
+        return assignments
 
     # --- Step 4: Save Results ---
-    def _save_results(self):
-        """Saves the solved timetable from the solver memory into the ScheduledClass database model."""
-        ScheduledClass.objects.all().delete() # Clear old schedule first
+    def _save_results(self, assignments):
+        """Saves the solved timetable ({req_id: (day, period, room_index)}) into ScheduledClass."""
         new_classes = []
-        req_lookup = {r["id"]: r for r in self.class_requirements} # Easy lookup by ID
-
-        for (req_id, day, period, room_id), var in self.variables.items():
-            if self.solver.Value(var) == 1:
-                req_data = req_lookup[req_id]
-                new_classes.append(ScheduledClass(
-                    day=day,
-                    period=period,
-                    classroom_id=room_id,
-                    faculty=req_data["faculty"],
-                    subject=req_data["subject"],
-                    section=req_data["section"],
-                    class_type=req_data["class_type"]
-                ))
+
+        for req_data in self.class_requirements:
+            day, period, room_index = assignments[req_data["id"]]
+            new_classes.append(ScheduledClass(
+                day=day,
+                period=period,
+                classroom_id=self.all_classrooms[room_index].id,
+                faculty_id=req_data["faculty_id"],
+                subject_id=req_data["subject_id"],
+                section_id=req_data["section_id"],
+                class_type=req_data["class_type"]
+            ))
         
-        ScheduledClass.objects.bulk_create(new_classes)
+        # Clear the old schedule and insert the new one atomically, in bounded
+        # batches, so a failed save never leaves a half-written timetable.
+        with transaction.atomic():
+            ScheduledClass.objects.all().delete()
+            ScheduledClass.objects.bulk_create(new_classes, batch_size=500)
         print(f"Successfully saved {len(new_classes)} scheduled classes to database.")
\ No newline at end of file
@@ -1,52 +1,65 @@
+import logging
+
 from django.shortcuts import render
 from .models import ScheduledClass, Section
 
+logger = logging.getLogger(__name__)
+
 DAYS_OF_WEEK = range(1, 7)   # Monday - Saturday
 PERIODS = range(1, 9)        # Periods 1 - 8
 
+# Constant display labels, computed once at import instead of per request.
+DAY_NAMES = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday"]
+PERIOD_HEADERS = [f"Period {p}" for p in PERIODS]
+
 def view_timetable(request):
     sections = Section.objects.all()
     selected_section_id = request.GET.get('section_id')
     table_rows = []
 
-    # --- DEBUGGING STEP 1 ---
-    print(f"\n[DEBUG] Request received. Selected Section ID: {selected_section_id}")
+    logger.debug("Request received. Selected Section ID: %s", selected_section_id)
 
     if selected_section_id:
-        scheduled_classes = ScheduledClass.objects.filter(section_id=selected_section_id).select_related(
-            'subject', 'faculty', 'classroom'
+        scheduled_classes = ScheduledClass.objects.filter(section_id=selected_section_id).values_list(
+            'day', 'period', 'subject__code', 'subject__name', 'faculty__name', 'classroom__name'
         )
 
-        # --- DEBUGGING STEP 2 ---
-        print(f"[DEBUG] Classes found in database for section {selected_section_id}: {len(scheduled_classes)}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Classes found in database for section %s: %s",
+                selected_section_id, len(scheduled_classes),
+            )
 
-        # Build timetable grid (day → period)
-        temp_grid = {day: {period: None for period in PERIODS} for day in DAYS_OF_WEEK}
-        for s_class in scheduled_classes:
-            if s_class.day in temp_grid and s_class.period in temp_grid[s_class.day]:
-                temp_grid[s_class.day][s_class.period] = s_class
+        # Build timetable grid (day → period) as a preallocated list-of-lists,
+        # with plain display dicts per cell — no model instances to deref.
+        grid = [[None] * len(PERIODS) for _ in DAYS_OF_WEEK]
+        for day, period, subject_code, subject_name, faculty_name, classroom_name in scheduled_classes:
+            if 1 <= day <= len(grid) and 1 <= period <= len(grid[0]):
+                grid[day - 1][period - 1] = {
+                    # Same "code: name" format as Subject.__str__, built once here.
+                    'subject': f"{subject_code}: {subject_name}",
+                    'faculty': faculty_name,
+                    'classroom': classroom_name,
+                }
 
         # Build rows (now day-wise, with periods as cells)
         for day in DAYS_OF_WEEK:
-            row_data = {'day_number': day, 
-                         'day_name': ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday"][day - 1],
-                         'cells': []
-                        }
-            for period in PERIODS:
-                row_data['cells'].append(temp_grid[day][period])
-            table_rows.append(row_data)
+            table_rows.append({
+                'day_number': day,
+                'day_name': DAY_NAMES[day - 1],
+                'cells': grid[day - 1],
+            })
 
-        # --- DEBUGGING STEP 3 ---
-        print(f"[DEBUG] Number of rows prepared for template: {len(table_rows)}")
+        logger.debug("Number of rows prepared for template: %s", len(table_rows))
 
     else:
-        print("[DEBUG] No section ID selected. Sending empty page.")
+        logger.debug("No section ID selected. Sending empty page.")
 
     context = {
         'sections': sections,
         'selected_section_id': int(selected_section_id) if selected_section_id else None,
         'table_rows': table_rows,
-        'day_headers': ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday"],
-        'period_headers': [f"Period {p}" for p in PERIODS]
+        'day_headers': DAY_NAMES,
+        'period_headers': PERIOD_HEADERS
     }
     return render(request, 'scheduler/timetable_display.html', context)